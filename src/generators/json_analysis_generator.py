@@ -10,7 +10,7 @@ import json
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, cast
+from typing import Any, Dict, Optional, TextIO, cast
 
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
@@ -32,6 +32,7 @@ class JSONAnalysisGenerator:
         self.document_path = document_path
         self.analyzer = TextAnalyzer(document_path)
         self.generated_at = datetime.now()
+        self._baseline_scenarios: Optional[Dict[str, Any]] = None
 
     def generate_comprehensive_analysis(
         self, include_all_typists: bool = False
@@ -61,6 +62,13 @@ class JSONAnalysisGenerator:
 
         return analysis_data
 
+    def _get_baseline_scenarios(self) -> Dict[str, Any]:
+        """Get scenarios for the average typist, computed once per generator."""
+        if self._baseline_scenarios is None:
+            calculator = TypingCostCalculator(self.document_path, 0.28)
+            self._baseline_scenarios = calculator.analyze_all_scenarios()
+        return self._baseline_scenarios
+
     def _generate_metadata(self, stats: Dict) -> Dict[str, Any]:
         """Generate metadata section."""
         return {
@@ -194,8 +202,7 @@ class JSONAnalysisGenerator:
     def _generate_research_questions(self) -> Dict[str, Any]:
         """Generate research questions and answers."""
         # Use average typist for research questions
-        calculator = TypingCostCalculator(self.document_path, 0.28)
-        scenarios = calculator.analyze_all_scenarios()
+        scenarios = self._get_baseline_scenarios()
 
         return {
             "q1": {
@@ -296,8 +303,7 @@ class JSONAnalysisGenerator:
     def _generate_impact_projections(self) -> Dict[str, Any]:
         """Generate government impact projections."""
         # Calculate based on optimal savings
-        calculator = TypingCostCalculator(self.document_path, 0.28)
-        scenarios = calculator.analyze_all_scenarios()
+        scenarios = self._get_baseline_scenarios()
 
         minutes_saved = (
             scenarios["thai_kedmanee"]["total_cost_minutes"]
@@ -335,8 +341,7 @@ class JSONAnalysisGenerator:
 
     def _generate_key_findings(self) -> Dict[str, Any]:
         """Generate key findings summary."""
-        calculator = TypingCostCalculator(self.document_path, 0.28)
-        scenarios = calculator.analyze_all_scenarios()
+        scenarios = self._get_baseline_scenarios()
 
         current_time = scenarios["thai_kedmanee"]["total_cost_minutes"]
         optimal_time = scenarios["intl_pattajoti"]["total_cost_minutes"]
@@ -393,14 +398,22 @@ class JSONAnalysisGenerator:
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
 
         with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(analysis_data, f, indent=2, ensure_ascii=False)
+            self.save_to_stream(analysis_data, f)
 
         return output_path
 
+    def save_to_stream(self, analysis_data: Dict[str, Any], stream: TextIO) -> None:
+        """Write analysis data as JSON to an open text stream."""
+        # Encode once and write once; json.dump issues a write per chunk
+        stream.write(json.dumps(analysis_data, indent=2, ensure_ascii=False))
+
     def load_from_file(self, json_path: str) -> Dict[str, Any]:
         """Load analysis data from JSON file."""
-        with open(json_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return json.loads(Path(json_path).read_bytes())
+
+    def load_from_stream(self, stream: TextIO) -> Dict[str, Any]:
+        """Load analysis data from an open text stream."""
+        return json.loads(stream.read())
 
 
 def main() -> None:
@@ -10,6 +10,7 @@ import argparse
 import os
 import sys
 from pathlib import Path
+from typing import List, Optional
 
 # Add the src directory to Python path for imports
 sys.path.insert(0, str(Path(__file__).parent))
@@ -18,8 +19,8 @@ from generators.json_analysis_generator import JSONAnalysisGenerator
 from models.typist_profiles import TypistProfile
 
 
-def render_simple_comparison_markdown(analysis_data: dict, output_path: str) -> None:
-    """Render simple comparison table markdown report."""
+def build_simple_comparison_markdown(analysis_data: dict) -> str:
+    """Build simple comparison table markdown report from in-memory analysis data."""
     metadata = analysis_data.get("metadata", {})
     document_stats = metadata.get("document_stats", {})
     typist_profiles = analysis_data.get("typist_profiles", {})
@@ -100,9 +101,13 @@ def render_simple_comparison_markdown(analysis_data: dict, output_path: str) ->
             )
             content.append("")
 
-    # Write to file
+    return "\n".join(content)
+
+
+def render_simple_comparison_markdown(analysis_data: dict, output_path: str) -> None:
+    """Render simple comparison table markdown report."""
     with open(output_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(content))
+        f.write(build_simple_comparison_markdown(analysis_data))
 
 
 def create_output_directories(base_output_dir: str) -> None:
@@ -110,8 +115,13 @@ def create_output_directories(base_output_dir: str) -> None:
     Path(base_output_dir).mkdir(parents=True, exist_ok=True)
 
 
-def generate_analysis(document_path: str, output_dir: str) -> None:
-    """Generate comprehensive JSON and markdown analysis for all scenarios."""
+def generate_analysis(
+    document_path: str, output_dir: str, include_markdown: bool = True
+) -> int:
+    """Generate comprehensive JSON and markdown analysis for all scenarios.
+
+    Returns a process exit code (0 on success, 1 if the analysis failed).
+    """
     print("\n" + "=" * 80)
     print("THAI NUMBERS TYPING COST COMPARISON")
     print("=" * 80)
@@ -128,7 +138,10 @@ def generate_analysis(document_path: str, output_dir: str) -> None:
         generator.save_to_file(analysis_data, json_path)
         print(f"\n📦 JSON ANALYSIS SAVED: {json_path}")
 
-        # Always generate simplified markdown comparison report
+        if not include_markdown:
+            return 0
+
+        # Generate simplified markdown comparison report
         timestamp = (
             analysis_data["metadata"]["generated_at"]
             .replace(":", "")
@@ -143,11 +156,16 @@ def generate_analysis(document_path: str, output_dir: str) -> None:
 
     except Exception as e:
         print(f"\n⚠️  Analysis failed: {e}")
-        sys.exit(1)
+        return 1
 
+    return 0
 
-def main() -> None:
-    """Simplified Thai Numbers Typing Cost Comparison."""
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Simplified Thai Numbers Typing Cost Comparison.
+
+    Returns a process exit code; argparse usage errors still raise SystemExit.
+    """
     parser = argparse.ArgumentParser(
         description="Thai Numbers Typing Cost Comparison - Automatically analyzes all scenarios",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -159,6 +177,9 @@ Examples:
   # Specify custom output directory
   python main.py ../data/thai-con.txt --output ../results
 
+  # Generate JSON analysis only (skip the markdown report)
+  python main.py ../data/thai-con.txt --no-markdown
+
   # Show available typist profiles
   python main.py --list-typists
         """,
@@ -170,18 +191,23 @@ Examples:
         default=None,
         help="Output directory for analysis files (default: project root/output)",
     )
+    parser.add_argument(
+        "--no-markdown",
+        action="store_true",
+        help="Skip the markdown comparison report (JSON analysis only)",
+    )
     parser.add_argument(
         "--list-typists",
         action="store_true",
         help="List available typist profiles and exit",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Handle list-typists command
     if args.list_typists:
         TypistProfile.list_profiles()
-        return
+        return 0
 
     # Document path is required for analysis
     if not args.document:
@@ -190,7 +216,7 @@ Examples:
     # Validate document path
     if not os.path.exists(args.document):
         print(f"Error: Document not found at {args.document}")
-        sys.exit(1)
+        return 1
 
     # Determine output directory (always absolute path, never inside src)
     if args.output:
@@ -211,8 +237,10 @@ Examples:
     print("=" * 80)
 
     # Generate comprehensive analysis
-    generate_analysis(args.document, output_dir)
+    return generate_analysis(
+        args.document, output_dir, include_markdown=not args.no_markdown
+    )
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
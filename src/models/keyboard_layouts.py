@@ -5,7 +5,7 @@ Defines Thai Kedmanee and Pattajoti keyboard layouts with typing cost calculatio
 """
 
 from enum import Enum
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 
 class KeyboardType(Enum):
@@ -60,7 +60,8 @@ class ThaiKeyboardLayout:
             char: Character to calculate cost for
             base_keystroke_time: Base time per keystroke in seconds
         """
-        key_info = self.get_key_info(char)
+        # Read the key map directly; this is the per-character hot path
+        key_info = self.key_map.get(char)
         if not key_info:
             return base_keystroke_time  # Default cost for unknown characters
 
@@ -72,6 +73,29 @@ class ThaiKeyboardLayout:
 
         return cost
 
+    def calculate_typing_cost_bulk(
+        self, chars: str, base_keystroke_time: float = 0.28
+    ) -> List[float]:
+        """Calculate typing cost for each character of a string in seconds.
+
+        Equivalent to calling calculate_typing_cost per character, but reads
+        the key map directly instead of going through two method calls each.
+
+        Args:
+            chars: Characters to calculate costs for
+            base_keystroke_time: Base time per keystroke in seconds
+        """
+        key_map = self.key_map
+        shifted_cost = base_keystroke_time * 2.0
+        return [
+            (
+                shifted_cost
+                if (key_info := key_map.get(char)) and key_info.requires_shift
+                else base_keystroke_time
+            )
+            for char in chars
+        ]
+
     def get_layout_info(self) -> Dict:
         """Get information about the keyboard layout."""
         total_keys = len(self.key_map)
@@ -457,6 +481,46 @@ class PattajotiLayout(ThaiKeyboardLayout):
         self.key_map.update(thai_characters)
 
 
+def _build_explanation() -> str:
+    """Build the keyboard row system explanation text."""
+    content = []
+    content.append("KEYBOARD ROW SYSTEM EXPLANATION")
+    content.append("=" * 50)
+    content.append("Based on TIS 820-2535 Thai Keyboard Layout Standard")
+    content.append("")
+    content.append("Physical keyboard layout (side view):")
+    content.append("")
+    content.append("Row 3: [1][2][3][4][5][6][7][8][9][0]  ← Numbers (hardest)")
+    content.append("Row 2: [Q][W][E][R][T][Y][U][I][O][P]  ← Top row")
+    content.append("Row 1: [A][S][D][F][G][H][J][K][L][;]  ← HOME ROW (easiest)")
+    content.append("Row 0: [Z][X][C][V][B][N][M][,][.][/]  ← Bottom row")
+    content.append("       [    SPACE BAR    ]              ← Thumbs")
+    content.append("")
+    content.append("Typing difficulty by row:")
+    content.append("  Row 1 (Home): Fingers naturally rest here - FASTEST")
+    content.append("  Row 2 (Top):  Short upward movement - moderate")
+    content.append("  Row 0 (Bottom): Short downward movement - moderate")
+    content.append("  Row 3 (Numbers): Long upward stretch - SLOWEST")
+    content.append("")
+    content.append("LAYOUT COMPARISON:")
+    content.append("=" * 50)
+    content.append("KEDMANEE (TIS 820-2535 Standard):")
+    content.append("  - Thai digits (๐-๙): Row 3 + SHIFT required = 2x penalty")
+    content.append("  - International (0-9): Row 3 only = 1x penalty")
+    content.append("  - Standard QWERTY-based layout with Thai character overlay")
+    content.append("")
+    content.append("PATTAJOTI (Thai-optimized layout):")
+    content.append("  - Thai digits (๒๓๔๕๗๘๙๐๑๖): Row 3, NO SHIFT = 1x penalty")
+    content.append("  - International (1234567890): Row 3 only = 1x penalty")
+    content.append("  - Optimized character placement for Thai text efficiency")
+    content.append("")
+    content.append("KEY INSIGHT: Kedmanee's SHIFT requirement for Thai digits")
+    content.append("             creates significant typing cost penalty!")
+    content.append("")
+
+    return "\n".join(content)
+
+
 def explain_keyboard_rows() -> None:
     """Explain the keyboard row system used in cost calculations.
 
@@ -464,65 +528,38 @@ def explain_keyboard_rows() -> None:
     - TIS 820-2535: Thai Keyboard Layout Standard (Kedmanee)
     - Pattajoti keyboard layout specification
     """
-    print("KEYBOARD ROW SYSTEM EXPLANATION")
-    print("=" * 50)
-    print("Based on TIS 820-2535 Thai Keyboard Layout Standard")
-    print()
-    print("Physical keyboard layout (side view):")
-    print()
-    print("Row 3: [1][2][3][4][5][6][7][8][9][0]  ← Numbers (hardest)")
-    print("Row 2: [Q][W][E][R][T][Y][U][I][O][P]  ← Top row")
-    print("Row 1: [A][S][D][F][G][H][J][K][L][;]  ← HOME ROW (easiest)")
-    print("Row 0: [Z][X][C][V][B][N][M][,][.][/]  ← Bottom row")
-    print("       [    SPACE BAR    ]              ← Thumbs")
-    print()
-    print("Typing difficulty by row:")
-    print("  Row 1 (Home): Fingers naturally rest here - FASTEST")
-    print("  Row 2 (Top):  Short upward movement - moderate")
-    print("  Row 0 (Bottom): Short downward movement - moderate")
-    print("  Row 3 (Numbers): Long upward stretch - SLOWEST")
-    print()
-    print("LAYOUT COMPARISON:")
-    print("=" * 50)
-    print("KEDMANEE (TIS 820-2535 Standard):")
-    print("  - Thai digits (๐-๙): Row 3 + SHIFT required = 2x penalty")
-    print("  - International (0-9): Row 3 only = 1x penalty")
-    print("  - Standard QWERTY-based layout with Thai character overlay")
-    print()
-    print("PATTAJOTI (Thai-optimized layout):")
-    print("  - Thai digits (๒๓๔๕๗๘๙๐๑๖): Row 3, NO SHIFT = 1x penalty")
-    print("  - International (1234567890): Row 3 only = 1x penalty")
-    print("  - Optimized character placement for Thai text efficiency")
-    print()
-    print("KEY INSIGHT: Kedmanee's SHIFT requirement for Thai digits")
-    print("             creates significant typing cost penalty!")
-    print()
+    print(_build_explanation())
 
 
-def compare_layouts(
+def _build_comparison(
     base_keystroke_time: float = 0.28, use_weights: bool = True
-) -> None:
-    """Compare keyboard layouts for digit typing costs."""
+) -> str:
+    """Build the digit typing cost comparison text for both layouts."""
     kedmanee = KedmaneeLayout()
     pattajoti = PattajotiLayout()
 
     weight_mode = "weighted" if use_weights else "unweighted"
-    print(f"KEYBOARD LAYOUT COMPARISON ({weight_mode})")
-    print("=" * 60)
+    content = []
+    content.append(f"KEYBOARD LAYOUT COMPARISON ({weight_mode})")
+    content.append("=" * 60)
 
-    print("\nKedmanee Layout Info:")
+    content.append("\nKedmanee Layout Info:")
     kedmanee_info = kedmanee.get_layout_info()
     for key, value in kedmanee_info.items():
-        print(f"  {key}: {value}")
+        content.append(f"  {key}: {value}")
 
-    print("\nPattajoti Layout Info:")
+    content.append("\nPattajoti Layout Info:")
     pattajoti_info = pattajoti.get_layout_info()
     for key, value in pattajoti_info.items():
-        print(f"  {key}: {value}")
+        content.append(f"  {key}: {value}")
 
-    print(f"\nDIGIT TYPING COSTS ({weight_mode}, base time: {base_keystroke_time}s):")
-    print(f"{'Digit':<8} {'Kedmanee':<12} {'Pattajoti':<12} {'Difference':<12}")
-    print("-" * 50)
+    content.append(
+        f"\nDIGIT TYPING COSTS ({weight_mode}, base time: {base_keystroke_time}s):"
+    )
+    content.append(
+        f"{'Digit':<8} {'Kedmanee':<12} {'Pattajoti':<12} {'Difference':<12}"
+    )
+    content.append("-" * 50)
 
     # Compare Thai digits
     thai_digits = ["๐", "๑", "๒", "๓", "๔", "๕", "๖", "๗", "๘", "๙"]
@@ -530,9 +567,9 @@ def compare_layouts(
         ked_cost = kedmanee.calculate_typing_cost(digit, base_keystroke_time)
         pat_cost = pattajoti.calculate_typing_cost(digit, base_keystroke_time)
         diff = ked_cost - pat_cost
-        print(f"{digit:<8} {ked_cost:<12.3f} {pat_cost:<12.3f} {diff:+.3f}")
+        content.append(f"{digit:<8} {ked_cost:<12.3f} {pat_cost:<12.3f} {diff:+.3f}")
 
-    print()
+    content.append("")
 
     # Compare international digits
     intl_digits = ["0", "1", "2", "3", "4", "5", "6", "7", "8", "9"]
@@ -540,7 +577,16 @@ def compare_layouts(
         ked_cost = kedmanee.calculate_typing_cost(digit, base_keystroke_time)
         pat_cost = pattajoti.calculate_typing_cost(digit, base_keystroke_time)
         diff = ked_cost - pat_cost
-        print(f"{digit:<8} {ked_cost:<12.3f} {pat_cost:<12.3f} {diff:+.3f}")
+        content.append(f"{digit:<8} {ked_cost:<12.3f} {pat_cost:<12.3f} {diff:+.3f}")
+
+    return "\n".join(content)
+
+
+def compare_layouts(
+    base_keystroke_time: float = 0.28, use_weights: bool = True
+) -> None:
+    """Compare keyboard layouts for digit typing costs."""
+    print(_build_comparison(base_keystroke_time, use_weights))
 
 
 if __name__ == "__main__":
@@ -4,9 +4,15 @@ Thai Numbers Typing Cost Analysis - Text Analyzer
 Analyzes Thai constitution text for numeric character usage patterns.
 """
 
+import copy
 import re
 from collections import Counter
-from typing import Dict, List
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Sequences of digits (Thai or international), compiled once for every analyzer
+_DIGIT_SEQUENCE_PATTERN = re.compile(r"[๐-๙0-9]+")
+_THAI_DIGIT_PATTERN = re.compile(r"[๐-๙]")
 
 
 class TextAnalyzer:
@@ -19,19 +25,59 @@ class TextAnalyzer:
     def __init__(self, file_path: str):
         """Initialize analyzer with text file."""
         self.file_path = file_path
-        self.text = self._load_text()
+        self._init_text(self._load_text())
+
+    @classmethod
+    def from_text(cls, text: str, path: str = "<memory>") -> "TextAnalyzer":
+        """Create an analyzer for text already in memory, without file I/O."""
+        analyzer = cls.__new__(cls)
+        analyzer.file_path = path
+        analyzer._init_text(text)
+        return analyzer
+
+    def _init_text(self, text: str) -> None:
+        """Set the analyzed text and reset the per-text caches."""
+        self.text = text
         self.thai_digit_chars = set(chr(i) for i in self.THAI_DIGITS)
         self.intl_digit_chars = set(chr(i) for i in self.INTERNATIONAL_DIGITS)
+        self._digit_runs: Optional[List[re.Match[str]]] = None
+        self._digit_counts: Optional[Counter[str]] = None
+        self._number_contexts: Optional[List[Dict]] = None
+        self._statistics: Optional[Dict] = None
 
     def _load_text(self) -> str:
-        """Load text from file."""
-        with open(self.file_path, "r", encoding="utf-8") as f:
-            return f.read()
+        """Load text from file.
+
+        The file is read in one call and decoded once; line endings are
+        normalized to "\\n" as text-mode open() would do.
+        """
+        text = Path(self.file_path).read_bytes().decode("utf-8")
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
+
+    def _get_digit_runs(self) -> List[re.Match[str]]:
+        """Find every digit sequence in the text in one regex pass, cached.
+
+        Counts, per-digit breakdowns and contexts are all derived from these
+        matches, so the full text is scanned only once per analyzer.
+        """
+        if self._digit_runs is None:
+            self._digit_runs = list(_DIGIT_SEQUENCE_PATTERN.finditer(self.text))
+        return self._digit_runs
+
+    def _get_digit_counts(self) -> Counter[str]:
+        """Tally the digits of the cached sequences once and cache the result."""
+        if self._digit_counts is None:
+            runs = self._get_digit_runs()
+            self._digit_counts = Counter("".join(run.group() for run in runs))
+        return self._digit_counts
 
     def count_numeric_characters(self) -> Dict[str, int]:
         """Count all numeric characters by type."""
-        thai_count = sum(1 for char in self.text if char in self.thai_digit_chars)
-        intl_count = sum(1 for char in self.text if char in self.intl_digit_chars)
+        digit_counts = self._get_digit_counts()
+        thai_count = sum(digit_counts[char] for char in self.thai_digit_chars)
+        intl_count = sum(digit_counts[char] for char in self.intl_digit_chars)
 
         return {
             "thai_digits": thai_count,
@@ -41,49 +87,61 @@ class TextAnalyzer:
 
     def analyze_digit_usage(self) -> Dict:
         """Detailed analysis of digit usage patterns."""
-        thai_digits: Counter[str] = Counter()
-        intl_digits: Counter[str] = Counter()
+        digit_counts = self._get_digit_counts()
 
-        for char in self.text:
-            if char in self.thai_digit_chars:
-                thai_digits[char] += 1
-            elif char in self.intl_digit_chars:
-                intl_digits[char] += 1
+        # Counter keeps first-occurrence order, so breakdowns follow the text
+        thai_digits = {
+            char: count
+            for char, count in digit_counts.items()
+            if char in self.thai_digit_chars
+        }
+        intl_digits = {
+            char: count
+            for char, count in digit_counts.items()
+            if char in self.intl_digit_chars
+        }
 
         return {
-            "thai_digit_breakdown": dict(thai_digits),
-            "intl_digit_breakdown": dict(intl_digits),
+            "thai_digit_breakdown": thai_digits,
+            "intl_digit_breakdown": intl_digits,
             "thai_digit_unicode": {char: f"U+{ord(char):04X}" for char in thai_digits},
             "intl_digit_unicode": {char: f"U+{ord(char):04X}" for char in intl_digits},
         }
 
     def find_number_contexts(self) -> List[Dict]:
         """Find contexts where numbers appear in the text."""
-        # Pattern to match sequences of digits (Thai or international)
-        digit_pattern = r"[๐-๙0-9]+"
+        # Copy the cached entries so callers cannot corrupt later results
+        return [dict(ctx) for ctx in self._get_number_contexts()]
+
+    def _get_number_contexts(self) -> List[Dict]:
+        """Get the number contexts, scanned once per analyzer."""
+        if self._number_contexts is None:
+            self._number_contexts = self._scan_number_contexts()
+        return self._number_contexts
+
+    def _scan_number_contexts(self) -> List[Dict]:
+        """Build a context entry for each cached digit sequence."""
+        text = self.text
         contexts = []
 
-        for match in re.finditer(digit_pattern, self.text):
+        for match in self._get_digit_runs():
             start, end = match.span()
             number = match.group()
 
-            # Get surrounding context (80 chars before and after)
-            context_start = max(0, start - 80)
-            context_end = min(len(self.text), end + 80)
-            context = self.text[context_start:context_end]
+            # Get surrounding context (80 chars before and after); slicing
+            # clamps the end to the text length
+            context = text[max(0, start - 80) : end + 80]
 
-            # Determine number type
-            has_thai = any(char in self.thai_digit_chars for char in number)
-            has_intl = any(char in self.intl_digit_chars for char in number)
+            # Determine number type; a match holds only digits, so any Thai
+            # digit makes it Thai and otherwise it is international
+            has_thai = _THAI_DIGIT_PATTERN.search(number) is not None
 
             contexts.append(
                 {
                     "number": number,
                     "position": (start, end),
                     "context": context.strip(),
-                    "type": (
-                        "thai" if has_thai else "international" if has_intl else "mixed"
-                    ),
+                    "type": "thai" if has_thai else "international",
                     "length": len(number),
                 }
             )
@@ -91,10 +149,20 @@ class TextAnalyzer:
         return contexts
 
     def get_statistics(self) -> Dict:
-        """Get comprehensive statistics about the text."""
+        """Get comprehensive statistics about the text, computed once per analyzer.
+
+        The text does not change after loading, so repeated calls (report
+        printing, JSON generation) reuse one result; each call returns a copy.
+        """
+        if self._statistics is None:
+            self._statistics = self._compute_statistics()
+        return copy.deepcopy(self._statistics)
+
+    def _compute_statistics(self) -> Dict:
+        """Build the statistics dictionary returned by get_statistics()."""
         counts = self.count_numeric_characters()
         analysis = self.analyze_digit_usage()
-        contexts = self.find_number_contexts()
+        contexts = self._get_number_contexts()
 
         # Character statistics
         total_chars = len(self.text)
@@ -2,16 +2,18 @@
 Test configuration and fixtures for Thai Numbers Typing Cost Analysis tests.
 """
 
+import os
 import sys
 from pathlib import Path
 
 import pytest
 
-# Add src directory to path for imports
+# Add src directory to path for imports (once, for every test module)
 test_dir = Path(__file__).parent
 project_root = test_dir.parent
-src_dir = project_root / "src"
-sys.path.insert(0, str(src_dir))
+src_dir = str(project_root / "src")
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
 
 from calculators.typing_cost_calculator import TypingCostCalculator
 from generators.json_analysis_generator import JSONAnalysisGenerator
@@ -19,6 +21,11 @@ from models.keyboard_layouts import KedmaneeLayout, PattajotiLayout
 from models.text_analyzer import TextAnalyzer
 
 
+def missing_needles(text, needles):
+    """Return the set of needles that do not occur anywhere in the text."""
+    return {needle for needle in needles if needle not in text}
+
+
 @pytest.fixture(scope="session")
 def project_root_path():
     """Get the project root path."""
@@ -48,10 +55,10 @@ def sample_thai_text():
 """
 
 
-@pytest.fixture
-def sample_thai_text_file(tmp_path, sample_thai_text):
-    """Create a temporary file with sample Thai text."""
-    test_file = tmp_path / "sample_thai.txt"
+@pytest.fixture(scope="session")
+def sample_thai_text_file(tmp_path_factory, sample_thai_text):
+    """Create a temporary file with sample Thai text (shared, read-only)."""
+    test_file = tmp_path_factory.mktemp("sample") / "sample_thai.txt"
     test_file.write_text(sample_thai_text, encoding="utf-8")
     return str(test_file)
 
@@ -70,31 +77,54 @@ def text_analyzer(sample_thai_text_file):
     return TextAnalyzer(sample_thai_text_file)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def kedmanee_layout():
-    """Create a KedmaneeLayout instance."""
+    """Create a KedmaneeLayout instance (read-only, shared by all tests)."""
     return KedmaneeLayout()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def pattajoti_layout():
-    """Create a PattajotiLayout instance."""
+    """Create a PattajotiLayout instance (read-only, shared by all tests)."""
     return PattajotiLayout()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def typing_cost_calculator(sample_thai_text_file):
-    """Create a TypingCostCalculator instance with sample data."""
+    """Create a TypingCostCalculator instance with sample data (read-only, shared)."""
     return TypingCostCalculator(sample_thai_text_file, base_keystroke_time=0.28)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def json_analysis_generator(sample_thai_text_file):
-    """Create a JSONAnalysisGenerator instance with sample data."""
+    """Create a JSONAnalysisGenerator instance shared by the whole session.
+
+    Tests only read from the generator, so its parsed document is reused.
+    """
     return JSONAnalysisGenerator(sample_thai_text_file)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def analysis_cache():
+    """Memoized comprehensive analysis keyed by (document path, all typists).
+
+    Results are shared across the session; tests must treat them as read-only.
+    """
+    cache = {}
+
+    def get_analysis(document_path, include_all_typists=False):
+        key = (os.fspath(document_path), include_all_typists)
+        if key not in cache:
+            generator = JSONAnalysisGenerator(key[0])
+            cache[key] = generator.generate_comprehensive_analysis(
+                include_all_typists=include_all_typists
+            )
+        return cache[key]
+
+    return get_analysis
+
+
+@pytest.fixture(scope="session")
 def typist_profiles():
     """Standard typist profiles for testing."""
     return {
@@ -121,16 +151,16 @@ def typist_profiles():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def thai_digits():
-    """List of Thai digits for testing."""
-    return ["๐", "๑", "๒", "๓", "๔", "๕", "๖", "๗", "๘", "๙"]
+    """Tuple of Thai digits for testing."""
+    return ("๐", "๑", "๒", "๓", "๔", "๕", "๖", "๗", "๘", "๙")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def international_digits():
-    """List of international digits for testing."""
-    return ["0", "1", "2", "3", "4", "5", "6", "7", "8", "9"]
+    """Tuple of international digits for testing."""
+    return ("0", "1", "2", "3", "4", "5", "6", "7", "8", "9")
 
 
 @pytest.fixture
@@ -7,64 +7,85 @@ Tests end-to-end functionality including command-line interface,
 file operations, and complete analysis pipelines.
 """
 
-import os
-import sys
-from pathlib import Path
+import io
+import re
+import shutil
+from contextlib import redirect_stdout
 
 import pytest
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+from main import build_simple_comparison_markdown, main
+from models.typist_profiles import TypistProfile
+from tests.conftest import missing_needles
 
-from main import TypistProfile, main
+PROFILE_KEYS = ("expert", "skilled", "average", "worst")
+SCENARIO_KEYS = ("thai_kedmanee", "intl_kedmanee", "thai_pattajoti", "intl_pattajoti")
+
+# Console banners printed by main()
+AUTOMATIC_BANNER = "AUTOMATIC COMPARISON: ALL SCENARIOS & TYPIST PROFILES"
+ANALYSIS_BANNER = "THAI NUMBERS TYPING COST COMPARISON"
+JSON_SAVED_BANNER = "📦 JSON ANALYSIS SAVED"
+REPORT_BANNER = "📄 COMPARISON REPORT GENERATED"
+
+# Typing times are rendered with one decimal place in the markdown report
+_ONE_DECIMAL_PATTERN = re.compile(r"\d+\.\d")
+
+
+@pytest.fixture(scope="session")
+def _baseline_analysis(tmp_path_factory, sample_thai_text_file):
+    """Run the full CLI pipeline once per session on the sample document.
+
+    Returns the output directory and the captured console output.
+    """
+    output_dir = tmp_path_factory.mktemp("baseline") / "output"
+
+    console = io.StringIO()
+    with redirect_stdout(console):
+        exit_code = main([sample_thai_text_file, "--output", str(output_dir)])
+    assert exit_code == 0
+
+    return output_dir, console.getvalue()
+
+
+@pytest.fixture
+def baseline_output(tmp_path, _baseline_analysis):
+    """Per-test copy of the session baseline output directory."""
+    baseline_dir, _ = _baseline_analysis
+    output_dir = tmp_path / "output"
+    shutil.copytree(baseline_dir, output_dir)
+    return output_dir
 
 
 class TestBasicCLIWorkflows:
     """Test suite for basic CLI workflows."""
 
-    def test_cli_basic_analysis(
-        self, sample_thai_text_file, tmp_path, monkeypatch, capsys
-    ):
+    def test_cli_basic_analysis(self, baseline_output, _baseline_analysis):
         """Test basic CLI analysis workflow."""
-        # Use --output to direct output to tmp directory
-        output_dir = tmp_path / "output"
-        test_args = ["main.py", sample_thai_text_file, "--output", str(output_dir)]
-        monkeypatch.setattr("sys.argv", test_args)
-
-        # Run main function
-        main()
+        output_dir = baseline_output
 
         # Check console output
-        captured = capsys.readouterr()
-        assert "AUTOMATIC COMPARISON: ALL SCENARIOS & TYPIST PROFILES" in captured.out
-        assert "📦 JSON ANALYSIS SAVED" in captured.out
-        assert "📄 COMPARISON REPORT GENERATED" in captured.out
+        _, console_output = _baseline_analysis
+        missing = missing_needles(
+            console_output, (AUTOMATIC_BANNER, JSON_SAVED_BANNER, REPORT_BANNER)
+        )
+        assert not missing, f"Missing console banners: {missing}"
 
         # Check that both JSON and markdown are always created
         json_file = output_dir / "analysis.json"
         assert json_file.exists()
 
         # Check for markdown report (with timestamp)
-        markdown_files = list(output_dir.glob("comparison_report_*.md"))
-        assert len(markdown_files) >= 1
+        assert any(output_dir.glob("comparison_report_*.md"))
 
-    def test_cli_analyzes_all_typist_profiles(
-        self, sample_thai_text_file, tmp_path, monkeypatch, capsys
-    ):
+    def test_cli_analyzes_all_typist_profiles(self, baseline_output):
         """Test CLI automatically analyzes all typist profiles."""
-        # Use --output to direct output to tmp directory
-        output_dir = tmp_path / "output"
-        test_args = ["main.py", sample_thai_text_file, "--output", str(output_dir)]
-        monkeypatch.setattr("sys.argv", test_args)
-
-        main()
+        output_dir = baseline_output
 
         # Check that JSON contains all typist profiles
         json_file = output_dir / "analysis.json"
         assert json_file.exists()
 
-        with open(json_file, "r", encoding="utf-8") as f:
-            analysis_data = json.load(f)
+        analysis_data = json.loads(json_file.read_bytes())
 
         # Should have all 4 typist profiles
         typist_profiles = analysis_data["typist_profiles"]
@@ -73,241 +94,167 @@ class TestBasicCLIWorkflows:
         assert len(typist_profiles) == 4
         assert len(analysis_results) == 4
 
-        for profile_key in ["expert", "skilled", "average", "worst"]:
+        for profile_key in PROFILE_KEYS:
             assert profile_key in typist_profiles
             assert profile_key in analysis_results
 
-    def test_cli_list_typists(self, monkeypatch, capsys):
+    def test_cli_list_typists(self, capsys):
         """Test CLI --list-typists functionality."""
-        test_args = ["main.py", "--list-typists"]
-        monkeypatch.setattr("sys.argv", test_args)
+        assert main(["--list-typists"]) == 0
 
-        main()
+        output = capsys.readouterr().out
 
-        captured = capsys.readouterr()
-        assert "Available Typist Profiles:" in captured.out
-
-        # Should list all profiles
+        # Should list all profiles (key, name and keystroke time)
+        expected = ["Available Typist Profiles:"]
         for profile_key, profile in TypistProfile.PROFILES.items():
-            assert profile_key in captured.out
-            assert profile["name"] in captured.out
-            assert str(profile["keystroke_time"]) in captured.out
+            expected += [profile_key, profile["name"], str(profile["keystroke_time"])]
+        missing = [text for text in expected if text not in output]
+        assert not missing, f"Missing from --list-typists output: {missing}"
 
-    def test_cli_invalid_document_path(self, monkeypatch, capsys):
+    def test_cli_invalid_document_path(self, capsys):
         """Test CLI with invalid document path."""
-        test_args = ["main.py", "/nonexistent/path.txt"]
-        monkeypatch.setattr("sys.argv", test_args)
-
-        with pytest.raises(SystemExit) as exc_info:
-            main()
-
-        assert exc_info.value.code == 1
-
-        captured = capsys.readouterr()
-        assert "Error: Document not found" in captured.out
+        assert main(["/nonexistent/path.txt"]) == 1
+        assert "Error: Document not found" in capsys.readouterr().out
 
 
 class TestFileOperations:
     """Test suite for file operations and I/O."""
 
-    def test_cli_creates_output_directories(
-        self, sample_thai_text_file, tmp_path, monkeypatch
-    ):
+    def test_cli_creates_output_directories(self, baseline_output):
         """Test that CLI creates necessary output directories."""
-        # Use --output to direct output to tmp directory
-        output_dir = tmp_path / "output"
-        test_args = ["main.py", sample_thai_text_file, "--output", str(output_dir)]
-        monkeypatch.setattr("sys.argv", test_args)
-
-        main()
+        output_dir = baseline_output
 
         # Check that output directory was created and JSON file exists
         assert output_dir.exists()
         json_file = output_dir / "analysis.json"
         assert json_file.exists()
 
-    def test_cli_handles_unicode_paths(self, tmp_path, monkeypatch):
-        """Test CLI with Unicode file paths."""
-        # Create Thai text file with Unicode name
-        unicode_file = tmp_path / "ไฟล์ไทย.txt"
-        unicode_file.write_text("ปี ๒๕๖๐ มีความสำคัญ", encoding="utf-8")
-
-        # Use --output to direct output to tmp directory
+    @pytest.mark.slow
+    @pytest.mark.parametrize(
+        "file_name,content",
+        [
+            ("ไฟล์ไทย.txt", "ปี ๒๕๖๐ มีความสำคัญ"),
+            ("file with spaces.txt", "ปี ๒๕๖๐ test"),
+            ("thai_content.txt", "วิเคราะห์ตัวเลขไทย ๑๒๓๔๕ และตัวเลขสากล 67890"),
+            ("empty.txt", ""),
+            ("no_digits.txt", "สวัสดี Hello World ไม่มีตัวเลข"),
+        ],
+        ids=["unicode", "spaces", "thai_content", "empty", "no_digits"],
+    )
+    def test_cli_handles_path_variants(self, tmp_path, capsys, file_name, content):
+        """Test CLI with unusual file names and document contents."""
+        document = tmp_path / file_name
+        document.write_text(content, encoding="utf-8")
+
+        # Use --output to direct output to tmp directory; only JSON is checked
         output_dir = tmp_path / "output"
-        test_args = ["main.py", str(unicode_file), "--output", str(output_dir)]
-        monkeypatch.setattr("sys.argv", test_args)
+        test_args = [str(document), "--output", str(output_dir), "--no-markdown"]
 
-        main()
+        assert main(test_args) == 0
 
-        # Should handle Unicode paths without issues and create JSON file
-        assert output_dir.exists()
-        json_file = output_dir / "analysis.json"
-        assert json_file.exists()
+        # Should complete the analysis and create the JSON file
+        output = capsys.readouterr().out
+        missing = missing_needles(output, (ANALYSIS_BANNER, JSON_SAVED_BANNER))
+        assert not missing, f"Missing console banners: {missing}"
+        assert (output_dir / "analysis.json").exists()
 
-    def test_cli_handles_spaces_in_paths(self, tmp_path, monkeypatch):
-        """Test CLI with spaces in file paths."""
-        # Create file with spaces in name
-        spaced_file = tmp_path / "file with spaces.txt"
-        spaced_file.write_text("ปี ๒๕๖๐ test", encoding="utf-8")
-
-        # Use --output to direct output to tmp directory
-        output_dir = tmp_path / "output"
-        test_args = ["main.py", str(spaced_file), "--output", str(output_dir)]
-        monkeypatch.setattr("sys.argv", test_args)
-
-        main()
-
-        # Should handle spaced paths without issues and create JSON file
-        assert output_dir.exists()
-        json_file = output_dir / "analysis.json"
-        assert json_file.exists()
-
-    def test_cli_preserves_file_encoding(self, tmp_path, monkeypatch, capsys):
-        """Test that CLI preserves UTF-8 encoding in analysis."""
-        # Create Thai text file
-        thai_file = tmp_path / "thai_content.txt"
-        thai_content = "วิเคราะห์ตัวเลขไทย ๑๒๓๔๕ และตัวเลขสากล 67890"
-        thai_file.write_text(thai_content, encoding="utf-8")
-
-        # Use --output to direct output to tmp directory
-        output_dir = tmp_path / "output"
-        test_args = ["main.py", str(thai_file), "--output", str(output_dir)]
-        monkeypatch.setattr("sys.argv", test_args)
-
-        main()
-
-        # Check that analysis ran successfully with Thai characters
-        captured = capsys.readouterr()
-        assert "THAI NUMBERS TYPING COST COMPARISON" in captured.out
-        assert "📦 JSON ANALYSIS SAVED" in captured.out
-        # Analysis should handle Thai characters without errors
+        # --no-markdown skips the comparison report
+        assert REPORT_BANNER not in output
+        assert not any(output_dir.glob("comparison_report_*.md"))
 
 
 class TestErrorHandling:
     """Test suite for error handling and edge cases."""
 
-    def test_cli_handles_empty_document(self, tmp_path, monkeypatch, capsys):
-        """Test CLI with empty document."""
-        empty_file = tmp_path / "empty.txt"
-        empty_file.write_text("", encoding="utf-8")
-
-        # Use --output to direct output to tmp directory
-        output_dir = tmp_path / "output"
-        test_args = ["main.py", str(empty_file), "--output", str(output_dir)]
-        monkeypatch.setattr("sys.argv", test_args)
-
-        main()
-
-        # Should handle empty document gracefully
-        captured = capsys.readouterr()
-        assert "📦 JSON ANALYSIS SAVED" in captured.out
-        assert "THAI NUMBERS TYPING COST COMPARISON" in captured.out
-
-    def test_cli_handles_document_without_digits(self, tmp_path, monkeypatch, capsys):
-        """Test CLI with document containing no digits."""
-        no_digits_file = tmp_path / "no_digits.txt"
-        no_digits_file.write_text("สวัสดี Hello World ไม่มีตัวเลข", encoding="utf-8")
-
-        # Use --output to direct output to tmp directory
-        output_dir = tmp_path / "output"
-        test_args = ["main.py", str(no_digits_file), "--output", str(output_dir)]
-        monkeypatch.setattr("sys.argv", test_args)
+    def test_cli_analysis_failure_returns_error_code(self, tmp_path, capsys):
+        """Test that a failing analysis returns exit code 1 instead of exiting."""
+        # A directory exists but cannot be read as a document
+        test_args = [str(tmp_path), "--output", str(tmp_path / "output")]
 
-        main()
-
-        # Should handle no digits gracefully
-        captured = capsys.readouterr()
-        assert "📦 JSON ANALYSIS SAVED" in captured.out
+        assert main(test_args) == 1
+        assert "Analysis failed" in capsys.readouterr().out
 
     def test_cli_invalid_arguments_show_help(self, monkeypatch, capsys):
         """Test that invalid arguments show help message."""
         test_args = ["main.py", "--invalid-argument"]
         monkeypatch.setattr("sys.argv", test_args)
 
-        with pytest.raises(SystemExit):
+        with pytest.raises(SystemExit) as exc_info:
             main()
 
-        captured = capsys.readouterr()
-        # Should show help or error message
-        assert len(captured.err) > 0 or len(captured.out) > 0
+        # argparse (reading sys.argv) reports usage errors with exit code 2
+        assert exc_info.value.code == 2
+        assert "unrecognized arguments" in capsys.readouterr().err
 
 
 class TestEndToEndWorkflows:
     """Test suite for complete end-to-end workflows."""
 
-    def test_complete_analysis_workflow(
-        self, sample_thai_text_file, tmp_path, monkeypatch, capsys
-    ):
+    def test_complete_analysis_workflow(self, baseline_output):
         """Test complete analysis workflow from start to finish."""
-        # Use --output to direct output to tmp directory
-        output_dir = tmp_path / "output"
-        test_args = ["main.py", sample_thai_text_file, "--output", str(output_dir)]
-        monkeypatch.setattr("sys.argv", test_args)
-        main()
+        output_dir = baseline_output
 
         # Verify complete workflow outputs
         json_file = output_dir / "analysis.json"
         assert json_file.exists()
 
         # Check JSON content
-        with open(json_file, "r", encoding="utf-8") as f:
-            json_data = json.load(f)
+        json_data = json.loads(json_file.read_bytes())
 
         assert len(json_data["typist_profiles"]) == 4  # All typists
         assert len(json_data["analysis_results"]) == 4
 
         # Check markdown files were created
-        markdown_files = list(output_dir.glob("comparison_report_*.md"))
-        assert len(markdown_files) > 0
-
-        # Verify simplified markdown content
-        markdown_content = markdown_files[0].read_text(encoding="utf-8")
-        assert "# Thai Numbers Typing Analysis Comparison" in markdown_content
-        assert "## Typing Time Comparison (minutes)" in markdown_content
-        assert "## Detailed Breakdown by Typist Profile" in markdown_content
-
-    def test_json_and_markdown_data_consistency(
-        self, sample_thai_text_file, tmp_path, monkeypatch, capsys
-    ):
+        markdown_file = next(output_dir.glob("comparison_report_*.md"), None)
+        assert markdown_file is not None
+
+        # Verify simplified markdown content (headings are whole lines)
+        markdown_lines = set(markdown_file.read_text(encoding="utf-8").splitlines())
+        assert markdown_lines >= {
+            "# Thai Numbers Typing Analysis Comparison",
+            "## Typing Time Comparison (minutes)",
+            "## Detailed Breakdown by Typist Profile",
+        }
+
+    def test_json_and_markdown_data_consistency(self, baseline_output):
         """Test that JSON and markdown contain consistent data."""
-        # Use --output to direct output to tmp directory
-        output_dir = tmp_path / "output"
-        test_args = ["main.py", sample_thai_text_file, "--output", str(output_dir)]
-        monkeypatch.setattr("sys.argv", test_args)
-        main()
+        output_dir = baseline_output
 
         # Load JSON data
         json_file = output_dir / "analysis.json"
-        with open(json_file, "r", encoding="utf-8") as f:
-            json_data = json.load(f)
+        json_data = json.loads(json_file.read_bytes())
 
         # Load markdown data
-        markdown_files = list(output_dir.glob("comparison_report_*.md"))
-        assert len(markdown_files) > 0
-        markdown_content = markdown_files[0].read_text(encoding="utf-8")
+        markdown_file = next(output_dir.glob("comparison_report_*.md"), None)
+        assert markdown_file is not None
+        markdown_content = markdown_file.read_text(encoding="utf-8")
+
+        # Re-rendering the saved JSON in memory must reproduce the report exactly
+        assert build_simple_comparison_markdown(json_data) == markdown_content
 
         # Verify key data points are consistent between JSON and markdown
         # Check that all 4 typist profiles are represented
-        for profile_key in ["expert", "skilled", "average", "worst"]:
+        for profile_key in PROFILE_KEYS:
             assert profile_key in json_data["typist_profiles"]
             assert profile_key in json_data["analysis_results"]
 
-            # Profile name should appear in markdown
-            profile_name = json_data["typist_profiles"][profile_key]["name"]
-            assert profile_name in markdown_content
+        # Profile names should appear in markdown
+        profile_names = [
+            json_data["typist_profiles"][profile_key]["name"]
+            for profile_key in PROFILE_KEYS
+        ]
+        missing = missing_needles(markdown_content, profile_names)
+        assert not missing, f"Profile names missing from markdown: {missing}"
 
         # Check that typing times from JSON appear in markdown
-        for profile_key in ["expert", "skilled", "average", "worst"]:
+        # (collect every 1-decimal number in the report once, then look up)
+        numbers_in_markdown = set(_ONE_DECIMAL_PATTERN.findall(markdown_content))
+        for profile_key in PROFILE_KEYS:
             scenarios = json_data["analysis_results"][profile_key]["scenarios"]
-            for scenario_key in [
-                "thai_kedmanee",
-                "intl_kedmanee",
-                "thai_pattajoti",
-                "intl_pattajoti",
-            ]:
+            for scenario_key in SCENARIO_KEYS:
                 time_minutes = scenarios[scenario_key]["total_cost_minutes"]
                 # Time should appear in markdown (formatted to 1 decimal place)
-                assert f"{time_minutes:.1f}" in markdown_content
+                assert f"{time_minutes:.1f}" in numbers_in_markdown
 
 
 # Pytest markers
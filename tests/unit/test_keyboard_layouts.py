@@ -3,23 +3,90 @@ Unit tests for keyboard layout classes.
 
 Tests Thai keyboard layouts including Kedmanee and Pattajoti layouts,
 key information, cost calculations, and layout comparisons.
+
+Per-digit cases are parametrized so they can be spread across workers
+with pytest-xdist (``pytest -n auto``). Test classes carry xdist_group
+markers so ``--dist loadgroup`` keeps each class on a single worker.
 """
 
-import sys
-from pathlib import Path
+import io
+from contextlib import redirect_stdout
 
 import pytest
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
-
 from models.keyboard_layouts import (
     KeyboardType,
     KeyInfo,
     ThaiKeyboardLayout,
+    _build_comparison,
+    _build_explanation,
     compare_layouts,
     explain_keyboard_rows,
 )
+from tests.conftest import missing_needles
+
+# Headings expected in the keyboard row explanation
+EXPLANATION_NEEDLES = (
+    "KEYBOARD ROW SYSTEM EXPLANATION",
+    "Row 3:",
+    "Row 2:",
+    "Row 1:",
+    "Row 0:",
+    "KEDMANEE",
+    "PATTAJOTI",
+)
+
+# Headings expected in the layout comparison dump
+COMPARISON_NEEDLES = (
+    "KEYBOARD LAYOUT COMPARISON",
+    "Kedmanee Layout Info:",
+    "Pattajoti Layout Info:",
+    "DIGIT TYPING COSTS",
+)
+
+# Expected (hand, finger) for each digit key on the number row
+KEDMANEE_THAI_DIGIT_ASSIGNMENTS = {
+    "๑": ("left", "pinky"),
+    "๒": ("left", "ring"),
+    "๓": ("left", "middle"),
+    "๔": ("left", "index"),
+    "๕": ("left", "index"),
+    "๖": ("right", "index"),
+    "๗": ("right", "index"),
+    "๘": ("right", "middle"),
+    "๙": ("right", "ring"),
+    "๐": ("right", "pinky"),
+}
+KEDMANEE_INTL_DIGIT_ASSIGNMENTS = {
+    "1": ("left", "pinky"),
+    "2": ("left", "ring"),
+    "3": ("left", "middle"),
+    "4": ("left", "index"),
+    "5": ("left", "index"),
+    "6": ("right", "index"),
+    "7": ("right", "index"),
+    "8": ("right", "middle"),
+    "9": ("right", "ring"),
+    "0": ("right", "pinky"),
+}
+# Pattajoti Thai digits as (digit, hand, finger) in left-to-right key order
+PATTAJOTI_THAI_DIGIT_ORDER = (
+    ("๒", "left", "pinky"),
+    ("๓", "left", "ring"),
+    ("๔", "left", "middle"),
+    ("๕", "left", "index"),
+    ("๗", "left", "index"),
+    ("๘", "right", "index"),
+    ("๙", "right", "index"),
+    ("๐", "right", "middle"),
+    ("๑", "right", "ring"),
+    ("๖", "right", "pinky"),
+)
+
+
+def _batch_lookup(layout, chars):
+    """Look up key info for every character once, keyed by character."""
+    return dict(zip(chars, map(layout.get_key_info, chars)))
 
 
 class TestKeyboardType:
@@ -103,6 +170,8 @@ class TestThaiKeyboardLayout:
 class TestKedmaneeLayout:
     """Test suite for KedmaneeLayout class."""
 
+    pytestmark = [pytest.mark.xdist_group(name="TestKedmaneeLayout")]
+
     def test_kedmanee_initialization(self, kedmanee_layout):
         """Test KedmaneeLayout initialization."""
         assert kedmanee_layout.layout_type == KeyboardType.KEDMANEE
@@ -111,92 +180,68 @@ class TestKedmaneeLayout:
 
     def test_kedmanee_thai_digits_require_shift(self, kedmanee_layout, thai_digits):
         """Test that all Thai digits require SHIFT on Kedmanee."""
-        for digit in thai_digits:
-            key_info = kedmanee_layout.get_key_info(digit)
-            assert key_info is not None, f"Thai digit {digit} not found in layout"
-            assert (
-                key_info.requires_shift is True
-            ), f"Thai digit {digit} should require SHIFT"
-            assert key_info.row == 3, f"Thai digit {digit} should be on row 3"
+        infos = _batch_lookup(kedmanee_layout, thai_digits)
+        missing = [digit for digit, info in infos.items() if info is None]
+        assert not missing, f"Thai digits not found in layout: {missing}"
+
+        wrong = [
+            digit
+            for digit, info in infos.items()
+            if info.requires_shift is not True or info.row != 3
+        ]
+        assert not wrong, f"Thai digits should require SHIFT on row 3: {wrong}"
 
     def test_kedmanee_international_digits_no_shift(
         self, kedmanee_layout, international_digits
     ):
         """Test that international digits don't require SHIFT on Kedmanee."""
-        for digit in international_digits:
-            key_info = kedmanee_layout.get_key_info(digit)
-            assert (
-                key_info is not None
-            ), f"International digit {digit} not found in layout"
-            assert (
-                key_info.requires_shift is False
-            ), f"International digit {digit} should not require SHIFT"
-            assert key_info.row == 3, f"International digit {digit} should be on row 3"
+        infos = _batch_lookup(kedmanee_layout, international_digits)
+        missing = [digit for digit, info in infos.items() if info is None]
+        assert not missing, f"International digits not found in layout: {missing}"
+
+        wrong = [
+            digit
+            for digit, info in infos.items()
+            if info.requires_shift is not False or info.row != 3
+        ]
+        assert not wrong, f"International digits should be unshifted on row 3: {wrong}"
 
-    def test_kedmanee_digit_finger_assignments(self, kedmanee_layout):
+    @pytest.mark.parametrize(
+        "digit,hand,finger",
+        [(digit, *where) for digit, where in KEDMANEE_THAI_DIGIT_ASSIGNMENTS.items()],
+    )
+    def test_kedmanee_digit_finger_assignments(
+        self, kedmanee_layout, digit, hand, finger
+    ):
         """Test Thai digit finger assignments match standard typing."""
-        expected_assignments = {
-            "๑": ("left", "pinky"),
-            "๒": ("left", "ring"),
-            "๓": ("left", "middle"),
-            "๔": ("left", "index"),
-            "๕": ("left", "index"),
-            "๖": ("right", "index"),
-            "๗": ("right", "index"),
-            "๘": ("right", "middle"),
-            "๙": ("right", "ring"),
-            "๐": ("right", "pinky"),
-        }
+        key_info = kedmanee_layout.get_key_info(digit)
+        assert (key_info.hand, key_info.finger) == (hand, finger)
 
-        for digit, (expected_hand, expected_finger) in expected_assignments.items():
-            key_info = kedmanee_layout.get_key_info(digit)
-            assert (
-                key_info.hand == expected_hand
-            ), f"Digit {digit} hand assignment incorrect"
-            assert (
-                key_info.finger == expected_finger
-            ), f"Digit {digit} finger assignment incorrect"
-
-    def test_kedmanee_international_digit_finger_assignments(self, kedmanee_layout):
+    @pytest.mark.parametrize(
+        "digit,hand,finger",
+        [(digit, *where) for digit, where in KEDMANEE_INTL_DIGIT_ASSIGNMENTS.items()],
+    )
+    def test_kedmanee_international_digit_finger_assignments(
+        self, kedmanee_layout, digit, hand, finger
+    ):
         """Test international digit finger assignments match standard typing."""
-        expected_assignments = {
-            "1": ("left", "pinky"),
-            "2": ("left", "ring"),
-            "3": ("left", "middle"),
-            "4": ("left", "index"),
-            "5": ("left", "index"),
-            "6": ("right", "index"),
-            "7": ("right", "index"),
-            "8": ("right", "middle"),
-            "9": ("right", "ring"),
-            "0": ("right", "pinky"),
-        }
-
-        for digit, (expected_hand, expected_finger) in expected_assignments.items():
-            key_info = kedmanee_layout.get_key_info(digit)
-            assert (
-                key_info.hand == expected_hand
-            ), f"Digit {digit} hand assignment incorrect"
-            assert (
-                key_info.finger == expected_finger
-            ), f"Digit {digit} finger assignment incorrect"
+        key_info = kedmanee_layout.get_key_info(digit)
+        assert (key_info.hand, key_info.finger) == (hand, finger)
 
     def test_kedmanee_common_thai_characters(self, kedmanee_layout):
         """Test that common Thai characters are included."""
-        common_chars = ["ก", "า", "น", "ร", "ส", "ห", "ม", "ล", "ว", "ด"]
+        common_chars = {"ก", "า", "น", "ร", "ส", "ห", "ม", "ล", "ว", "ด"}
 
-        for char in common_chars:
-            key_info = kedmanee_layout.get_key_info(char)
-            assert key_info is not None, f"Common Thai character {char} not found"
-            assert key_info.char == char
+        missing = common_chars - kedmanee_layout.key_map.keys()
+        assert not missing, f"Common Thai characters not found: {missing}"
+        assert all(kedmanee_layout.key_map[char].char == char for char in common_chars)
 
     def test_kedmanee_punctuation_and_space(self, kedmanee_layout):
         """Test that common punctuation and space are included."""
-        punctuation = [" ", ".", ",", "?", "!", '"', "(", ")"]
+        punctuation = {" ", ".", ",", "?", "!", '"', "(", ")"}
 
-        for char in punctuation:
-            key_info = kedmanee_layout.get_key_info(char)
-            assert key_info is not None, f"Punctuation {char} not found"
+        missing = punctuation - kedmanee_layout.key_map.keys()
+        assert not missing, f"Punctuation not found: {missing}"
 
     def test_kedmanee_layout_completeness(self, kedmanee_layout):
         """Test that Kedmanee layout has comprehensive character coverage."""
@@ -213,6 +258,8 @@ class TestKedmaneeLayout:
 class TestPattajotiLayout:
     """Test suite for PattajotiLayout class."""
 
+    pytestmark = [pytest.mark.xdist_group(name="TestPattajotiLayout")]
+
     def test_pattajoti_initialization(self, pattajoti_layout):
         """Test PattajotiLayout initialization."""
         assert pattajoti_layout.layout_type == KeyboardType.PATTAJOTI
@@ -221,65 +268,38 @@ class TestPattajotiLayout:
 
     def test_pattajoti_thai_digits_no_shift(self, pattajoti_layout, thai_digits):
         """Test that Thai digits don't require SHIFT on Pattajoti."""
-        for digit in thai_digits:
-            key_info = pattajoti_layout.get_key_info(digit)
-            assert key_info is not None, f"Thai digit {digit} not found in layout"
-            assert (
-                key_info.requires_shift is False
-            ), f"Thai digit {digit} should not require SHIFT"
-            assert key_info.row == 3, f"Thai digit {digit} should be on row 3"
+        infos = _batch_lookup(pattajoti_layout, thai_digits)
+        missing = [digit for digit, info in infos.items() if info is None]
+        assert not missing, f"Thai digits not found in layout: {missing}"
+
+        wrong = [
+            digit
+            for digit, info in infos.items()
+            if info.requires_shift is not False or info.row != 3
+        ]
+        assert not wrong, f"Thai digits should be unshifted on row 3: {wrong}"
 
     def test_pattajoti_international_digits_no_shift(
         self, pattajoti_layout, international_digits
     ):
         """Test that international digits don't require SHIFT on Pattajoti."""
-        for digit in international_digits:
-            key_info = pattajoti_layout.get_key_info(digit)
-            assert (
-                key_info is not None
-            ), f"International digit {digit} not found in layout"
-            assert (
-                key_info.requires_shift is False
-            ), f"International digit {digit} should not require SHIFT"
-            assert key_info.row == 3, f"International digit {digit} should be on row 3"
-
-    def test_pattajoti_thai_digit_order(self, pattajoti_layout):
-        """Test that Pattajoti Thai digits follow the correct left-to-right order."""
-        expected_order = ["๒", "๓", "๔", "๕", "๗", "๘", "๙", "๐", "๑", "๖"]
-        expected_fingers = [
-            "pinky",
-            "ring",
-            "middle",
-            "index",
-            "index",
-            "index",
-            "index",
-            "middle",
-            "ring",
-            "pinky",
-        ]
-        expected_hands = [
-            "left",
-            "left",
-            "left",
-            "left",
-            "left",
-            "right",
-            "right",
-            "right",
-            "right",
-            "right",
+        infos = _batch_lookup(pattajoti_layout, international_digits)
+        missing = [digit for digit, info in infos.items() if info is None]
+        assert not missing, f"International digits not found in layout: {missing}"
+
+        wrong = [
+            digit
+            for digit, info in infos.items()
+            if info.requires_shift is not False or info.row != 3
         ]
+        assert not wrong, f"International digits should be unshifted on row 3: {wrong}"
 
-        for i, digit in enumerate(expected_order):
-            key_info = pattajoti_layout.get_key_info(digit)
-            assert key_info is not None, f"Thai digit {digit} not found"
-            assert (
-                key_info.finger == expected_fingers[i]
-            ), f"Digit {digit} finger assignment incorrect"
-            assert (
-                key_info.hand == expected_hands[i]
-            ), f"Digit {digit} hand assignment incorrect"
+    @pytest.mark.parametrize("digit,hand,finger", PATTAJOTI_THAI_DIGIT_ORDER)
+    def test_pattajoti_thai_digit_order(self, pattajoti_layout, digit, hand, finger):
+        """Test that Pattajoti Thai digits follow the correct left-to-right order."""
+        key_info = pattajoti_layout.get_key_info(digit)
+        assert key_info is not None
+        assert (key_info.hand, key_info.finger) == (hand, finger)
 
     def test_pattajoti_layout_completeness(self, pattajoti_layout):
         """Test that Pattajoti layout has comprehensive character coverage."""
@@ -294,7 +314,7 @@ class TestPattajotiLayout:
 
     def test_pattajoti_vowel_and_tone_marks(self, pattajoti_layout):
         """Test that Pattajoti includes comprehensive vowel and tone mark coverage."""
-        vowels_and_tones = [
+        vowels_and_tones = {
             "า",
             "ิ",
             "ี",
@@ -310,18 +330,15 @@ class TestPattajotiLayout:
             "ำ",
             "ะ",
             "ั",
-        ]
-        tone_marks = ["่", "้", "๊", "๋", "์"]
+        }
+        tone_marks = {"่", "้", "๊", "๋", "์"}
 
-        for char in vowels_and_tones + tone_marks:
-            key_info = pattajoti_layout.get_key_info(char)
-            assert (
-                key_info is not None
-            ), f"Vowel/tone mark {char} not found in Pattajoti layout"
+        missing = (vowels_and_tones | tone_marks) - pattajoti_layout.key_map.keys()
+        assert not missing, f"Vowel/tone marks not found in Pattajoti layout: {missing}"
 
     def test_pattajoti_thai_consonants(self, pattajoti_layout):
         """Test that Pattajoti includes comprehensive Thai consonant coverage."""
-        consonants = [
+        consonants = {
             "ก",
             "ข",
             "ค",
@@ -339,18 +356,17 @@ class TestPattajotiLayout:
             "ส",
             "ห",
             "อ",
-        ]
+        }
 
-        for char in consonants:
-            key_info = pattajoti_layout.get_key_info(char)
-            assert (
-                key_info is not None
-            ), f"Consonant {char} not found in Pattajoti layout"
+        missing = consonants - pattajoti_layout.key_map.keys()
+        assert not missing, f"Consonants not found in Pattajoti layout: {missing}"
 
 
 class TestTypingCostCalculation:
     """Test suite for typing cost calculations."""
 
+    pytestmark = [pytest.mark.xdist_group(name="TestTypingCostCalculation")]
+
     def test_base_cost_calculation(self, kedmanee_layout):
         """Test basic cost calculation without modifiers."""
         base_time = 0.28
@@ -437,13 +453,25 @@ class TestTypingCostCalculation:
         expected_ked_cost = base_time * (2.0 if expected_kedmanee_shift else 1.0)
         expected_pat_cost = base_time * (2.0 if expected_pattajoti_shift else 1.0)
 
-        assert ked_cost == expected_ked_cost, f"Kedmanee cost for {digit} incorrect"
-        assert pat_cost == expected_pat_cost, f"Pattajoti cost for {digit} incorrect"
+        assert ked_cost == expected_ked_cost
+        assert pat_cost == expected_pat_cost
+
+    def test_bulk_cost_matches_per_character_cost(
+        self, kedmanee_layout, pattajoti_layout, sample_thai_text
+    ):
+        """Test that bulk cost calculation agrees with the per-character method."""
+        for layout in (kedmanee_layout, pattajoti_layout):
+            expected = [
+                layout.calculate_typing_cost(char, 0.28) for char in sample_thai_text
+            ]
+            assert layout.calculate_typing_cost_bulk(sample_thai_text, 0.28) == expected
 
 
 class TestLayoutComparison:
     """Test suite for layout comparison functionality."""
 
+    pytestmark = [pytest.mark.xdist_group(name="TestLayoutComparison")]
+
     def test_layout_info_structure(self, kedmanee_layout, pattajoti_layout):
         """Test that layout info returns expected structure."""
         ked_info = kedmanee_layout.get_layout_info()
@@ -458,7 +486,7 @@ class TestLayoutComparison:
 
         for info in [ked_info, pat_info]:
             for key in required_keys:
-                assert key in info, f"Layout info missing key: {key}"
+                assert key in info
 
             # Verify math
             assert (
@@ -466,85 +494,76 @@ class TestLayoutComparison:
                 == info["shifted_keys"] + info["non_shifted_keys"]
             )
 
-    def test_kedmanee_vs_pattajoti_digit_costs(self, kedmanee_layout, pattajoti_layout):
+    @pytest.mark.parametrize("digit", list("๐๑๒๓๔๕๖๗๘๙"))
+    def test_kedmanee_vs_pattajoti_digit_costs(
+        self, kedmanee_layout, pattajoti_layout, digit
+    ):
         """Test cost comparison between layouts for digits."""
         base_time = 0.28
-        thai_digits = ["๐", "๑", "๒", "๓", "๔", "๕", "๖", "๗", "๘", "๙"]
 
-        for digit in thai_digits:
-            ked_cost = kedmanee_layout.calculate_typing_cost(digit, base_time)
-            pat_cost = pattajoti_layout.calculate_typing_cost(digit, base_time)
+        ked_cost = kedmanee_layout.calculate_typing_cost(digit, base_time)
+        pat_cost = pattajoti_layout.calculate_typing_cost(digit, base_time)
 
-            # Kedmanee should always cost more for Thai digits (due to SHIFT)
-            assert (
-                ked_cost > pat_cost
-            ), f"Kedmanee should cost more than Pattajoti for Thai digit {digit}"
-            assert (
-                ked_cost == base_time * 2.0
-            ), f"Kedmanee cost for {digit} should be 2x base time"
-            assert (
-                pat_cost == base_time
-            ), f"Pattajoti cost for {digit} should be base time"
+        # Kedmanee should always cost more for Thai digits (due to SHIFT)
+        assert ked_cost > pat_cost
+        assert ked_cost == base_time * 2.0
+        assert pat_cost == base_time
 
-    def test_international_digits_equal_cost(self, kedmanee_layout, pattajoti_layout):
+    @pytest.mark.parametrize("digit", list("0123456789"))
+    def test_international_digits_equal_cost(
+        self, kedmanee_layout, pattajoti_layout, digit
+    ):
         """Test that international digits cost the same on both layouts."""
         base_time = 0.28
-        intl_digits = ["0", "1", "2", "3", "4", "5", "6", "7", "8", "9"]
 
-        for digit in intl_digits:
-            ked_cost = kedmanee_layout.calculate_typing_cost(digit, base_time)
-            pat_cost = pattajoti_layout.calculate_typing_cost(digit, base_time)
+        ked_cost = kedmanee_layout.calculate_typing_cost(digit, base_time)
+        pat_cost = pattajoti_layout.calculate_typing_cost(digit, base_time)
 
-            # International digits should cost the same on both layouts
-            assert (
-                ked_cost == pat_cost
-            ), f"International digit {digit} should cost same on both layouts"
-            assert (
-                ked_cost == base_time
-            ), f"International digit {digit} should cost base time"
+        # International digits should cost the same on both layouts
+        assert ked_cost == pat_cost
+        assert ked_cost == base_time
 
 
 class TestModuleFunctions:
     """Test suite for module-level functions."""
 
-    def test_explain_keyboard_rows_execution(self, capsys):
-        """Test that explain_keyboard_rows executes without errors."""
+    def test_explain_keyboard_rows_execution(self):
+        """Test that the keyboard row explanation is built without errors."""
+        explanation = _build_explanation()
+
+        missing = missing_needles(explanation, EXPLANATION_NEEDLES)
+        assert not missing, f"Missing from explanation: {missing}"
+
+    def test_compare_layouts_execution(self):
+        """Test that the layout comparison is built without errors."""
+        comparison = _build_comparison(base_keystroke_time=0.28)
+
+        missing = missing_needles(comparison, COMPARISON_NEEDLES)
+        assert not missing, f"Missing from comparison: {missing}"
+
+    def test_print_wrappers_match_builders(self, capsys):
+        """Test that the printing functions emit exactly the built text."""
         explain_keyboard_rows()
+        assert capsys.readouterr().out == _build_explanation() + "\n"
 
-        captured = capsys.readouterr()
-        assert "KEYBOARD ROW SYSTEM EXPLANATION" in captured.out
-        assert "Row 3:" in captured.out
-        assert "Row 2:" in captured.out
-        assert "Row 1:" in captured.out
-        assert "Row 0:" in captured.out
-        assert "KEDMANEE" in captured.out
-        assert "PATTAJOTI" in captured.out
-
-    def test_compare_layouts_execution(self, capsys):
-        """Test that compare_layouts executes without errors."""
         compare_layouts(base_keystroke_time=0.28)
+        assert capsys.readouterr().out == _build_comparison(0.28) + "\n"
 
-        captured = capsys.readouterr()
-        assert "KEYBOARD LAYOUT COMPARISON" in captured.out
-        assert "Kedmanee Layout Info:" in captured.out
-        assert "Pattajoti Layout Info:" in captured.out
-        assert "DIGIT TYPING COSTS" in captured.out
-
-    def test_compare_layouts_with_different_base_times(self, capsys):
+    @pytest.mark.parametrize("base_time", [0.12, 0.28, 1.2])
+    def test_compare_layouts_with_different_base_times(self, capsys, base_time):
         """Test compare_layouts with different base keystroke times."""
-        base_times = [0.12, 0.28, 1.2]
-
-        for base_time in base_times:
-            capsys.readouterr()  # Clear previous output
+        # Print straight into a StringIO, bypassing pytest's capture machinery
+        with capsys.disabled(), redirect_stdout(io.StringIO()) as console:
             compare_layouts(base_keystroke_time=base_time)
 
-            captured = capsys.readouterr()
-            assert f"base time: {base_time}s" in captured.out
+        assert f"base time: {base_time}s" in console.getvalue()
 
 
 class TestEdgeCases:
     """Test suite for edge cases and error conditions."""
 
+    pytestmark = [pytest.mark.xdist_group(name="TestEdgeCases")]
+
     def test_empty_character_handling(self, kedmanee_layout):
         """Test handling of empty character."""
         cost = kedmanee_layout.calculate_typing_cost("", 0.28)
@@ -579,44 +598,49 @@ class TestEdgeCases:
             "𝒽𝑒𝓁𝓁𝑜",  # Mathematical script characters
         ]
 
-        for char in edge_cases:
-            ked_cost = kedmanee_layout.calculate_typing_cost(char, 0.28)
-            pat_cost = pattajoti_layout.calculate_typing_cost(char, 0.28)
+        chars = "".join(edge_cases)
 
-            # Should handle gracefully and return base cost
-            assert ked_cost == 0.28
-            assert pat_cost == 0.28
+        # Should handle gracefully and return base cost for every character
+        expected = [0.28] * len(chars)
+        assert kedmanee_layout.calculate_typing_cost_bulk(chars, 0.28) == expected
+        assert pattajoti_layout.calculate_typing_cost_bulk(chars, 0.28) == expected
 
 
 class TestPerformance:
     """Test suite for performance-related tests."""
 
-    def test_large_scale_cost_calculation(self, kedmanee_layout, pattajoti_layout):
-        """Test performance with large number of cost calculations."""
+    pytestmark = [pytest.mark.xdist_group(name="TestPerformance")]
+
+    def test_cost_adds_up_across_repeated_cycles(
+        self, kedmanee_layout, pattajoti_layout
+    ):
+        """Test that a repeated digit cycle costs the cycle cost times the repeats."""
         base_time = 0.28
-        text = "๑๒๓๔๕๖๗๘๙๐" * 1000  # 10,000 characters
+        digits = "๑๒๓๔๕๖๗๘๙๐"
+        cycles = 3
 
-        # Should complete without performance issues
-        total_ked_cost = sum(
-            kedmanee_layout.calculate_typing_cost(char, base_time) for char in text
-        )
-        total_pat_cost = sum(
-            pattajoti_layout.calculate_typing_cost(char, base_time) for char in text
-        )
+        # Thai digits need SHIFT on Kedmanee (2x) but not on Pattajoti
+        for layout, modifier in ((kedmanee_layout, 2.0), (pattajoti_layout, 1.0)):
+            per_cycle = sum(layout.calculate_typing_cost_bulk(digits, base_time))
+            assert abs(per_cycle - len(digits) * base_time * modifier) < 0.01
 
-        # Verify calculations are correct
-        expected_ked_cost = len(text) * base_time * 2.0  # All Thai digits with SHIFT
-        expected_pat_cost = len(text) * base_time  # All Thai digits without SHIFT
+            text = digits * cycles
+            text_cost = sum(layout.calculate_typing_cost_bulk(text, base_time))
+            assert abs(text_cost - per_cycle * cycles) < 0.01
 
-        assert abs(total_ked_cost - expected_ked_cost) < 0.01
-        assert abs(total_pat_cost - expected_pat_cost) < 0.01
+    def test_cost_matches_key_map(self, kedmanee_layout):
+        """Test that every mapped character costs base time times its modifier."""
+        base_time = 0.28
+        chars = "".join(kedmanee_layout.key_map)
+        expected = [
+            base_time * (2.0 if kedmanee_layout.key_map[char].requires_shift else 1.0)
+            for char in chars
+        ]
 
-    def test_key_lookup_performance(self, kedmanee_layout):
-        """Test key lookup performance."""
-        # Should be able to perform many lookups quickly
-        for _ in range(10000):
-            key_info = kedmanee_layout.get_key_info("๑")
-            assert key_info is not None
+        assert [kedmanee_layout.calculate_typing_cost(c, base_time) for c in chars] == (
+            expected
+        )
+        assert kedmanee_layout.calculate_typing_cost_bulk(chars, base_time) == expected
 
 
 # Pytest markers
@@ -5,15 +5,17 @@ Tests text analysis functionality including digit counting, context extraction,
 and statistical analysis of Thai documents.
 """
 
-import sys
-from pathlib import Path
-
 import pytest
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
-
 from models.text_analyzer import TextAnalyzer
+from tests.conftest import missing_needles
+
+# Section headings of print_report
+REPORT_SECTIONS = (
+    "THAI CONSTITUTION NUMERIC CHARACTER ANALYSIS",
+    "DOCUMENT OVERVIEW:",
+    "DIGIT TYPE BREAKDOWN:",
+)
 
 
 class TestTextAnalyzer:
@@ -74,39 +76,46 @@ class TestTextAnalyzer:
         analyzer = TextAnalyzer(str(test_file))
         assert analyzer.text == text_content
 
-    def test_count_numeric_characters_thai_only(self, tmp_path):
-        """Test counting Thai digits only."""
-        text_content = "ปี ๒๕๖๐ มีความสำคัญ ตัวเลข ๑๒๓"
-        test_file = tmp_path / "thai_only.txt"
-        test_file.write_text(text_content, encoding="utf-8")
+    def test_load_text_normalizes_line_endings(self, tmp_path):
+        """Test that CRLF and CR line endings load as LF."""
+        test_file = tmp_path / "line_endings.txt"
+        test_file.write_bytes("ปี ๒๕๖๐\r\nมาตรา ๑\rมาตรา ๒\n".encode("utf-8"))
 
         analyzer = TextAnalyzer(str(test_file))
+        assert analyzer.text == "ปี ๒๕๖๐\nมาตรา ๑\nมาตรา ๒\n"
+
+    def test_from_text_matches_file_analysis(self, sample_thai_text_file):
+        """Test that in-memory text is analyzed the same as the file on disk."""
+        file_analyzer = TextAnalyzer(sample_thai_text_file)
+        analyzer = TextAnalyzer.from_text(file_analyzer.text)
+
+        assert analyzer.file_path == "<memory>"
+        assert analyzer.get_statistics() == file_analyzer.get_statistics()
+
+    def test_count_numeric_characters_thai_only(self):
+        """Test counting Thai digits only."""
+        text_content = "ปี ๒๕๖๐ มีความสำคัญ ตัวเลข ๑๒๓"
+        analyzer = TextAnalyzer.from_text(text_content)
         counts = analyzer.count_numeric_characters()
 
         assert counts["thai_digits"] == 7  # ๒๕๖๐๑๒๓
         assert counts["international_digits"] == 0
         assert counts["total_digits"] == 7
 
-    def test_count_numeric_characters_international_only(self, tmp_path):
+    def test_count_numeric_characters_international_only(self):
         """Test counting international digits only."""
         text_content = "Year 2017 is important, numbers 123"
-        test_file = tmp_path / "intl_only.txt"
-        test_file.write_text(text_content, encoding="utf-8")
-
-        analyzer = TextAnalyzer(str(test_file))
+        analyzer = TextAnalyzer.from_text(text_content)
         counts = analyzer.count_numeric_characters()
 
         assert counts["thai_digits"] == 0
         assert counts["international_digits"] == 7  # 2017123
         assert counts["total_digits"] == 7
 
-    def test_count_numeric_characters_mixed(self, tmp_path):
+    def test_count_numeric_characters_mixed(self):
         """Test counting mixed Thai and international digits."""
         text_content = "ปี ๒๕๖๐ คือ 2017 AD"
-        test_file = tmp_path / "mixed.txt"
-        test_file.write_text(text_content, encoding="utf-8")
-
-        analyzer = TextAnalyzer(str(test_file))
+        analyzer = TextAnalyzer.from_text(text_content)
         counts = analyzer.count_numeric_characters()
 
         assert counts["thai_digits"] == 4  # ๒๕๖๐
@@ -122,13 +131,10 @@ class TestTextAnalyzer:
         assert counts["international_digits"] == 0
         assert counts["total_digits"] == 0
 
-    def test_analyze_digit_usage_comprehensive(self, tmp_path):
+    def test_analyze_digit_usage_comprehensive(self):
         """Test detailed digit usage analysis."""
         text_content = "๑๒๑ และ 123 มีการใช้ ๐๐๙"
-        test_file = tmp_path / "usage_test.txt"
-        test_file.write_text(text_content, encoding="utf-8")
-
-        analyzer = TextAnalyzer(str(test_file))
+        analyzer = TextAnalyzer.from_text(text_content)
         analysis = analyzer.analyze_digit_usage()
 
         # Thai digit breakdown
@@ -146,13 +152,10 @@ class TestTextAnalyzer:
         assert analysis["thai_digit_unicode"]["๑"] == "U+0E51"
         assert analysis["intl_digit_unicode"]["1"] == "U+0031"
 
-    def test_find_number_contexts_basic(self, tmp_path):
+    def test_find_number_contexts_basic(self):
         """Test finding number contexts in text."""
         text_content = "เริ่มต้นปี ๒๕๖๐ และสิ้นสุดปี 2017 AD"
-        test_file = tmp_path / "context_test.txt"
-        test_file.write_text(text_content, encoding="utf-8")
-
-        analyzer = TextAnalyzer(str(test_file))
+        analyzer = TextAnalyzer.from_text(text_content)
         contexts = analyzer.find_number_contexts()
 
         assert len(contexts) == 2
@@ -171,13 +174,10 @@ class TestTextAnalyzer:
         assert intl_ctx["length"] == 4
         assert "สิ้นสุดปี" in intl_ctx["context"]
 
-    def test_find_number_contexts_long_sequences(self, tmp_path):
+    def test_find_number_contexts_long_sequences(self):
         """Test finding contexts for long number sequences."""
         text_content = "เลขไทย ๑๒๓๔๕๖๗๘๙๐ และเลขสากล 1234567890"
-        test_file = tmp_path / "long_seq.txt"
-        test_file.write_text(text_content, encoding="utf-8")
-
-        analyzer = TextAnalyzer(str(test_file))
+        analyzer = TextAnalyzer.from_text(text_content)
         contexts = analyzer.find_number_contexts()
 
         assert len(contexts) == 2
@@ -186,13 +186,10 @@ class TestTextAnalyzer:
         assert contexts[1]["number"] == "1234567890"
         assert contexts[1]["length"] == 10
 
-    def test_find_number_contexts_edge_of_text(self, tmp_path):
+    def test_find_number_contexts_edge_of_text(self):
         """Test finding contexts at the beginning and end of text."""
         text_content = "๑๒๓ เป็นตัวเลขเริ่มต้น และ 456"
-        test_file = tmp_path / "edge_test.txt"
-        test_file.write_text(text_content, encoding="utf-8")
-
-        analyzer = TextAnalyzer(str(test_file))
+        analyzer = TextAnalyzer.from_text(text_content)
         contexts = analyzer.find_number_contexts()
 
         assert len(contexts) == 2
@@ -206,24 +203,28 @@ class TestTextAnalyzer:
         last_ctx = contexts[1]
         assert last_ctx["context"].endswith("456")
 
-    def test_find_number_contexts_no_numbers(self, tmp_path):
+    def test_find_number_contexts_adjacent_digit_types(self):
+        """Test that adjacent Thai and international digits form one Thai run."""
+        analyzer = TextAnalyzer.from_text("รหัส ๑๒34 และ 56")
+        contexts = analyzer.find_number_contexts()
+
+        assert [(ctx["number"], ctx["type"]) for ctx in contexts] == [
+            ("๑๒34", "thai"),
+            ("56", "international"),
+        ]
+
+    def test_find_number_contexts_no_numbers(self):
         """Test finding contexts when no numbers exist."""
         text_content = "ไม่มีตัวเลขในข้อความนี้เลย"
-        test_file = tmp_path / "no_numbers.txt"
-        test_file.write_text(text_content, encoding="utf-8")
-
-        analyzer = TextAnalyzer(str(test_file))
+        analyzer = TextAnalyzer.from_text(text_content)
         contexts = analyzer.find_number_contexts()
 
         assert len(contexts) == 0
 
-    def test_get_statistics_comprehensive(self, tmp_path):
+    def test_get_statistics_comprehensive(self):
         """Test comprehensive statistics generation."""
         text_content = "ปี ๒๕๖๐\nมีความสำคัญ\nเลข 123 ด้วย"
-        test_file = tmp_path / "stats_test.txt"
-        test_file.write_text(text_content, encoding="utf-8")
-
-        analyzer = TextAnalyzer(str(test_file))
+        analyzer = TextAnalyzer.from_text(text_content)
         stats = analyzer.get_statistics()
 
         # Document stats
@@ -247,13 +248,10 @@ class TestTextAnalyzer:
         assert stats["number_sequences"]["thai_sequences"] == 1
         assert stats["number_sequences"]["intl_sequences"] == 1
 
-    def test_get_statistics_sequence_averages(self, tmp_path):
+    def test_get_statistics_sequence_averages(self):
         """Test calculation of average sequence lengths."""
         text_content = "๑ ๒๓ ๔๕๖ และ 1 23 456"  # Thai: 1,2,3 digits; Intl: 1,2,3 digits
-        test_file = tmp_path / "avg_test.txt"
-        test_file.write_text(text_content, encoding="utf-8")
-
-        analyzer = TextAnalyzer(str(test_file))
+        analyzer = TextAnalyzer.from_text(text_content)
         stats = analyzer.get_statistics()
 
         # Average Thai length: (1+2+3)/3 = 2.0
@@ -262,32 +260,40 @@ class TestTextAnalyzer:
         # Average International length: (1+2+3)/3 = 2.0
         assert abs(stats["number_sequences"]["avg_intl_length"] - 2.0) < 0.01
 
-    def test_get_statistics_no_sequences(self, tmp_path):
+    def test_get_statistics_no_sequences(self):
         """Test statistics when no number sequences exist."""
         text_content = "ไม่มีตัวเลข"
-        test_file = tmp_path / "no_seq.txt"
-        test_file.write_text(text_content, encoding="utf-8")
-
-        analyzer = TextAnalyzer(str(test_file))
+        analyzer = TextAnalyzer.from_text(text_content)
         stats = analyzer.get_statistics()
 
         assert stats["number_sequences"]["avg_thai_length"] == 0
         assert stats["number_sequences"]["avg_intl_length"] == 0
         assert stats["number_sequences"]["total_sequences"] == 0
 
-    def test_get_statistics_contexts_limit(self, tmp_path):
+    def test_get_statistics_contexts_limit(self):
         """Test that contexts are limited to first 10 entries."""
         # Create text with more than 10 number sequences
         numbers = " ".join([f"๑{i}" for i in range(15)])  # 15 sequences
-        test_file = tmp_path / "many_contexts.txt"
-        test_file.write_text(numbers, encoding="utf-8")
-
-        analyzer = TextAnalyzer(str(test_file))
+        analyzer = TextAnalyzer.from_text(numbers)
         stats = analyzer.get_statistics()
 
         assert len(stats["contexts"]) == 10
         assert stats["number_sequences"]["total_sequences"] == 15
 
+    def test_get_statistics_returns_independent_copies(self):
+        """Test that mutating a returned result does not change later calls."""
+        analyzer = TextAnalyzer.from_text("ปี ๒๕๖๐ และ 123")
+        stats = analyzer.get_statistics()
+        contexts = analyzer.find_number_contexts()
+
+        stats["digit_counts"]["thai_digits"] = -1
+        stats["contexts"].clear()
+        contexts[0]["number"] = "changed"
+
+        assert analyzer.get_statistics()["digit_counts"]["thai_digits"] == 4
+        assert len(analyzer.get_statistics()["contexts"]) == 2
+        assert analyzer.find_number_contexts()[0]["number"] == "๒๕๖๐"
+
     def test_print_report_execution(self, sample_thai_text_file, capsys):
         """Test that print_report executes without errors."""
         analyzer = TextAnalyzer(sample_thai_text_file)
@@ -295,44 +301,33 @@ class TestTextAnalyzer:
         # Should not raise any exceptions
         analyzer.print_report()
 
-        # Check that something was printed
-        captured = capsys.readouterr()
-        assert "THAI CONSTITUTION NUMERIC CHARACTER ANALYSIS" in captured.out
-        assert "DOCUMENT OVERVIEW:" in captured.out
-        assert "DIGIT TYPE BREAKDOWN:" in captured.out
-
-    def test_edge_case_single_character_file(self, tmp_path):
-        """Test analyzer with single character file."""
-        test_file = tmp_path / "single.txt"
-        test_file.write_text("๑", encoding="utf-8")
+        # Check that every report section was printed
+        missing = missing_needles(capsys.readouterr().out, REPORT_SECTIONS)
+        assert not missing, f"Missing report sections: {missing}"
 
-        analyzer = TextAnalyzer(str(test_file))
+    def test_edge_case_single_character_file(self):
+        """Test analyzer with single character text."""
+        analyzer = TextAnalyzer.from_text("๑")
         counts = analyzer.count_numeric_characters()
 
         assert counts["thai_digits"] == 1
         assert counts["international_digits"] == 0
         assert counts["total_digits"] == 1
 
-    def test_edge_case_only_whitespace(self, tmp_path):
+    def test_edge_case_only_whitespace(self):
         """Test analyzer with only whitespace."""
-        test_file = tmp_path / "whitespace.txt"
-        test_file.write_text("   \n\t  \n  ", encoding="utf-8")
-
-        analyzer = TextAnalyzer(str(test_file))
+        analyzer = TextAnalyzer.from_text("   \n\t  \n  ")
         counts = analyzer.count_numeric_characters()
 
         assert counts["thai_digits"] == 0
         assert counts["international_digits"] == 0
         assert counts["total_digits"] == 0
 
-    def test_unicode_handling_various_scripts(self, tmp_path):
+    def test_unicode_handling_various_scripts(self):
         """Test that analyzer correctly handles various Unicode scripts."""
         # Include various scripts but only count Thai and international digits
         text_content = "English ๑๒๓ العربية 456 中文 ๗๘๙ русский 789"
-        test_file = tmp_path / "unicode_test.txt"
-        test_file.write_text(text_content, encoding="utf-8")
-
-        analyzer = TextAnalyzer(str(test_file))
+        analyzer = TextAnalyzer.from_text(text_content)
         counts = analyzer.count_numeric_characters()
 
         assert counts["thai_digits"] == 6  # ๑๒๓๗๘๙
@@ -343,7 +338,7 @@ class TestTextAnalyzer:
 class TestTextAnalyzerIntegration:
     """Integration tests for TextAnalyzer with real-world scenarios."""
 
-    def test_with_real_thai_constitution_format(self, tmp_path):
+    def test_with_real_thai_constitution_format(self):
         """Test with text formatted like real Thai constitution."""
         text_content = """พระราชบัญญัติรัฐธรรมนูญแห่งราชอาณาจักรไทย พุทธศักราช ๒๕๖๐
 
@@ -354,10 +349,8 @@ class TestTextAnalyzerIntegration:
 บทเฉพาะกาล
 มาตรา ๒๗๙ รัฐธรรมนูญนี้ให้ใช้บังคับตั้งแต่วันที่ ๖ เมษายน พุทธศักราช ๒๕๖๐ เป็นต้นไป"""
 
-        test_file = tmp_path / "constitution.txt"
-        test_file.write_text(text_content, encoding="utf-8")
-
-        analyzer = TextAnalyzer(str(test_file))
+        # Analyze the constitution-formatted text in memory
+        analyzer = TextAnalyzer.from_text(text_content)
         stats = analyzer.get_statistics()
 
         # Should find Thai year and article numbers
@@ -365,16 +358,13 @@ class TestTextAnalyzerIntegration:
         assert "๒๕๖๐" in [ctx["number"] for ctx in stats["contexts"]]
         assert any("มาตรา" in ctx["context"] for ctx in stats["contexts"])
 
-    def test_performance_with_large_text(self, tmp_path):
+    def test_performance_with_large_text(self):
         """Test performance with relatively large text."""
-        # Create a larger text file (repeated content)
+        # Build a larger in-memory text (repeated content)
         base_content = "ปี ๒๕๖๐ เป็นปีสำคัญ และมี numbers 123 ด้วย\n"
         large_content = base_content * 1000  # 1000 lines
 
-        test_file = tmp_path / "large.txt"
-        test_file.write_text(large_content, encoding="utf-8")
-
-        analyzer = TextAnalyzer(str(test_file))
+        analyzer = TextAnalyzer.from_text(large_content)
 
         # Should complete without issues
         stats = analyzer.get_statistics()
@@ -7,16 +7,47 @@ Tests typing cost calculations, scenario analysis, digit conversions,
 and comprehensive reporting functionality.
 """
 
-import sys
-from pathlib import Path
-
 import pytest
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
-
-from calculators.typing_cost_calculator import TypingCostCalculator
+from calculators.typing_cost_calculator import TypingCostCalculator, main
 from models.keyboard_layouts import KedmaneeLayout, PattajotiLayout
+from tests.conftest import missing_needles
+
+# Section headings of print_comprehensive_report
+REPORT_SECTIONS = (
+    "THAI CONSTITUTION TYPING COST ANALYSIS",
+    "DOCUMENT STATISTICS:",
+    "TYPING COST BY SCENARIO:",
+    "TIME SAVINGS COMPARED TO CURRENT STATE",
+    "OPTIMAL SCENARIO ANALYSIS:",
+)
+
+# Expected result structure shared by the cost and savings tests
+SCENARIO_KEYS = ("thai_kedmanee", "intl_kedmanee", "thai_pattajoti", "intl_pattajoti")
+SAVINGS_SCENARIO_KEYS = SCENARIO_KEYS[1:]  # Every scenario except the baseline
+REQUIRED_DOCUMENT_COST_KEYS = frozenset(
+    {
+        "total_cost_seconds",
+        "total_cost_minutes",
+        "total_cost_hours",
+        "total_characters",
+        "average_cost_per_char",
+        "character_costs",
+        "digit_costs",
+        "keyboard_layout",
+        "conversion_applied",
+        "base_keystroke_time",
+    }
+)
+REQUIRED_SAVINGS_KEYS = frozenset(
+    {
+        "time_saved_seconds",
+        "time_saved_minutes",
+        "time_saved_hours",
+        "percentage_saved",
+        "cost_per_digit",
+    }
+)
 
 
 class TestTypingCostCalculatorInitialization:
@@ -154,21 +185,8 @@ class TestDocumentCostCalculation:
         )
 
         # Check result structure
-        required_keys = [
-            "total_cost_seconds",
-            "total_cost_minutes",
-            "total_cost_hours",
-            "total_characters",
-            "average_cost_per_char",
-            "character_costs",
-            "digit_costs",
-            "keyboard_layout",
-            "conversion_applied",
-            "base_keystroke_time",
-        ]
-
-        for key in required_keys:
-            assert key in result, f"Missing key: {key}"
+        missing = REQUIRED_DOCUMENT_COST_KEYS - result.keys()
+        assert not missing, f"Missing keys: {missing}"
 
         # Check data types and basic constraints
         assert isinstance(result["total_cost_seconds"], float)
@@ -275,14 +293,7 @@ class TestScenarioAnalysis:
         """Test that analyze_all_scenarios returns proper structure."""
         scenarios = typing_cost_calculator.analyze_all_scenarios()
 
-        expected_scenarios = [
-            "thai_kedmanee",
-            "intl_kedmanee",
-            "thai_pattajoti",
-            "intl_pattajoti",
-        ]
-
-        for scenario_name in expected_scenarios:
+        for scenario_name in SCENARIO_KEYS:
             assert scenario_name in scenarios, f"Missing scenario: {scenario_name}"
 
             scenario_data = scenarios[scenario_name]
@@ -347,22 +358,11 @@ class TestSavingsAnalysis:
         savings = typing_cost_calculator.calculate_savings_analysis(scenarios)
 
         # Should have savings for all scenarios except the baseline
-        expected_scenarios = ["intl_kedmanee", "thai_pattajoti", "intl_pattajoti"]
-
-        for scenario_name in expected_scenarios:
+        for scenario_name in SAVINGS_SCENARIO_KEYS:
             assert scenario_name in savings, f"Missing savings for: {scenario_name}"
 
-            saving_data = savings[scenario_name]
-            required_keys = [
-                "time_saved_seconds",
-                "time_saved_minutes",
-                "time_saved_hours",
-                "percentage_saved",
-                "cost_per_digit",
-            ]
-
-            for key in required_keys:
-                assert key in saving_data, f"Missing key in savings: {key}"
+            missing = REQUIRED_SAVINGS_KEYS - savings[scenario_name].keys()
+            assert not missing, f"Missing keys in savings: {missing}"
 
     def test_calculate_savings_analysis_baseline(self, typing_cost_calculator):
         """Test that baseline scenario (thai_kedmanee) is not in savings."""
@@ -429,25 +429,10 @@ class TestComprehensiveReport:
         scenarios, savings = typing_cost_calculator.print_comprehensive_report()
 
         # Check that report sections were printed
-        assert any(
-            "THAI CONSTITUTION TYPING COST ANALYSIS" in str(call)
-            for call in mock_print.call_args_list
-        )
-        assert any(
-            "DOCUMENT STATISTICS:" in str(call) for call in mock_print.call_args_list
-        )
-        assert any(
-            "TYPING COST BY SCENARIO:" in str(call)
-            for call in mock_print.call_args_list
-        )
-        assert any(
-            "TIME SAVINGS COMPARED TO CURRENT STATE" in str(call)
-            for call in mock_print.call_args_list
-        )
-        assert any(
-            "OPTIMAL SCENARIO ANALYSIS:" in str(call)
-            for call in mock_print.call_args_list
-        )
+        # (stringify the print calls once, then look up every heading)
+        printed = "\n".join(map(str, mock_print.call_args_list))
+        missing = missing_needles(printed, REPORT_SECTIONS)
+        assert not missing, f"Missing report sections: {missing}"
 
     def test_print_comprehensive_report_return_values(self, typing_cost_calculator):
         """Test that comprehensive report returns expected values."""
@@ -578,9 +563,6 @@ class TestMainFunction:
         with patch.object(
             TypingCostCalculator, "print_comprehensive_report"
         ) as mock_report:
-            # Import and run main
-            from calculators.typing_cost_calculator import main
-
             main()
 
             # Should create calculator with correct parameters
@@ -592,8 +574,6 @@ class TestMainFunction:
         monkeypatch.setattr("sys.argv", test_args)
 
         with pytest.raises(SystemExit) as exc_info:
-            from calculators.typing_cost_calculator import main
-
             main()
 
         assert exc_info.value.code == 1
@@ -607,8 +587,6 @@ class TestMainFunction:
         monkeypatch.setattr("sys.argv", test_args)
 
         with pytest.raises(SystemExit) as exc_info:
-            from calculators.typing_cost_calculator import main
-
             main()
 
         assert exc_info.value.code == 1
@@ -6,14 +6,8 @@ comprehensive coverage, and automated validation of keyboard layout models
 against official standards and touch typing practices.
 """
 
-import sys
-from pathlib import Path
-
 import pytest
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
-
 # Keyboard layout classes accessed through fixtures in conftest.py
 
 
@@ -690,32 +684,20 @@ class TestSystemIntegration:
 # Legacy validation test runner for backward compatibility
 def run_all_validations():
     """Run all validation tests in legacy format for backward compatibility."""
-    import subprocess
-    import sys
-
-    # Run pytest on this module
-    result = subprocess.run(
-        [sys.executable, "-m", "pytest", __file__, "-v", "--tb=short"],
-        capture_output=True,
-        text=True,
-    )
-
     print("THAI KEYBOARD LAYOUT VALIDATION TEST SUITE")
     print("=" * 60)
     print("Enhanced validation tests using pytest framework")
     print()
 
-    if result.returncode == 0:
+    # Run pytest on this module in-process (no interpreter re-spawn)
+    exit_code = pytest.main([__file__, "-v", "--tb=short"])
+
+    if exit_code == 0:
         print("🎉 ALL VALIDATIONS PASSED! Keyboard models are accurate.")
     else:
         print("⚠️  Some validations failed. Review keyboard model accuracy.")
-        print("\nTest output:")
-        print(result.stdout)
-        if result.stderr:
-            print("\nErrors:")
-            print(result.stderr)
 
-    return result.returncode == 0
+    return exit_code == 0
 
 
 if __name__ == "__main__":